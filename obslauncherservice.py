@@ -1,17 +1,44 @@
 import asyncio
+import atexit
+import functools
+import itertools
 import json
 import logging
 import os
+import shlex
 import signal
 import sys
-import uuid
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 import psutil  # For monitoring CPU and memory usage
-import websockets
-from websockets.exceptions import ConnectionClosedOK, ConnectionClosedError
-from logging.handlers import RotatingFileHandler
+from websockets.asyncio.server import ServerConnection, serve
+from websockets.exceptions import ConnectionClosed, ConnectionClosedOK, ConnectionClosedError
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+
+# Prefer orjson for JSON encoding/decoding (much faster than stdlib json and
+# serializes straight to UTF-8 bytes); fall back to stdlib json if unavailable.
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def json_loads(data: Any) -> Any:
+        return orjson.loads(data)
+
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def json_loads(data: Any) -> Any:
+        return json.loads(data)
+
+    JSONDecodeError = json.JSONDecodeError
 
 # Constants for default values with environment variable support
 DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS = os.getenv("WEBSOCKET_SERVER_IP_ADDRESS", "localhost")
@@ -20,9 +47,10 @@ DEFAULT_OBS_STUDIO_WORKING_DIRECTORY = os.getenv(
     "OBS_STUDIO_WORKING_DIRECTORY", r"C:\Program Files\obs-studio\bin\64bit\\"
 )
 DEFAULT_OBS_STUDIO_EXECUTABLE_FILE = os.getenv("OBS_STUDIO_EXECUTABLE_FILE", "obs64.exe")
-DEFAULT_OBS_STUDIO_EXECUTABLE_PATH = os.path.join(
-    DEFAULT_OBS_STUDIO_WORKING_DIRECTORY, DEFAULT_OBS_STUDIO_EXECUTABLE_FILE
-)
+# The default executable path and its parent are built once at import time so
+# the common launch path does no per-request path normalization.
+DEFAULT_OBS_STUDIO_EXECUTABLE_PATH = Path(DEFAULT_OBS_STUDIO_WORKING_DIRECTORY) / DEFAULT_OBS_STUDIO_EXECUTABLE_FILE
+DEFAULT_OBS_STUDIO_WORKING_DIRECTORY_PATH = DEFAULT_OBS_STUDIO_EXECUTABLE_PATH.parent
 
 # Setup logging with rotation
 log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
@@ -31,30 +59,37 @@ handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=5)
 handler.setFormatter(log_formatter)
 logger = logging.getLogger('OBSLauncherService')
 logger.setLevel(logging.DEBUG)
-logger.addHandler(handler)
 
 # Console handler
 console_handler = logging.StreamHandler(sys.stdout)
 console_handler.setFormatter(log_formatter)
-logger.addHandler(console_handler)
 
-# Global dictionary to manage WebSocket connections and associated pids
-connections: Dict[str, Dict[str, Any]] = {}
+# Route records through a queue so file/console writes (and log rotation)
+# happen on a listener thread instead of blocking the event loop.
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, handler, console_handler)
+log_listener.start()
+
+@dataclass(slots=True)
+class ConnectionState:
+    """Per-connection state; slotted so field access is a fixed offset load
+    instead of a dict lookup on every message."""
+    websocket: Any
+    obs_process: Optional[Any] = None
+    out_q: Optional[asyncio.Queue] = None
+    writer_task: Optional[asyncio.Task] = None
 
-# Logging helper functions
-def log_debug(message: str):
-    logger.debug(message)
-
-def log_info(message: str):
-    logger.info(message)
+# Global dictionary to manage WebSocket connections and associated pids
+connections: Dict[str, ConnectionState] = {}
 
-def log_warning(message: str):
-    logger.warning(message)
+# Maximum number of responses buffered per connection before producers block
+OUTBOUND_QUEUE_MAXSIZE = 256
 
-def log_error(message: str):
-    logger.error(message)
+# Maximum number of queued responses coalesced into a single send
+OUTBOUND_BATCH_SIZE = 32
 
-def create_json_response(command_uid: str, status: str, message: str, data: Optional[Dict[str, Any]] = None) -> str:
+def create_json_response(command_uid: str, status: str, message: str, data: Optional[Dict[str, Any]] = None) -> bytes:
     response = {
         "status": status,
         "command_uid": command_uid,
@@ -62,167 +97,355 @@ def create_json_response(command_uid: str, status: str, message: str, data: Opti
     }
     if data is not None:
         response["data"] = data
-    return json.dumps(response)
-
-async def handle_connection(websocket: websockets.WebSocketServerProtocol, path: str):
-    pid = str(uuid.uuid4())
-    connections[pid] = {"websocket": websocket, "obs_process": None}
-    log_info(f"New connection established with pid: {pid}")
+    return json_dumps(response)
+
+# Pre-serialized templates for the fixed-shape responses on the message hot
+# path. Dynamic fields are spliced in as JSON-encoded fragments (strings via
+# json_dumps so escaping stays correct, numbers via %d/%f), skipping a full
+# dict build + encode per frame. create_json_response remains the fallback for
+# responses with dynamic messages or open-ended data payloads.
+_ERR_INVALID_JSON = b'{"status":"error","command_uid":"unknown","message":"Invalid JSON format."}'
+_ERR_MISSING_FIELDS_TMPL = b'{"status":"error","command_uid":%b,"message":"Both \'command\' and \'command_uid\' are required."}'
+_ERR_UNKNOWN_COMMAND_TMPL = b'{"status":"error","command_uid":%b,"message":%b}'
+_OK_CONNECTED_TMPL = b'{"status":"success","command_uid":%b,"message":"WebSocket connected successfully.","data":{"ip_address":%b,"port":%d,"pid":%b}}'
+_OK_DISCONNECTED_TMPL = b'{"status":"success","command_uid":%b,"message":"WebSocket disconnected successfully."}'
+_ERR_NO_CONNECTION_TMPL = b'{"status":"error","command_uid":%b,"message":"WebSocket connection not found."}'
+_ERR_INVALID_PID_TMPL = b'{"status":"error","command_uid":%b,"message":"Invalid connection PID."}'
+_ERR_ALREADY_RUNNING_TMPL = b'{"status":"error","command_uid":%b,"message":"OBS Studio is already running."}'
+_OK_LAUNCHED_TMPL = b'{"status":"success","command_uid":%b,"message":"OBS Studio launched successfully.","data":{"app_pid":%d}}'
+_OK_STATUS_TMPL = b'{"status":"success","command_uid":%b,"message":"OBS Studio is running.","data":{"app_pid":%d,"status":%b,"cpu_usage":%.1f,"memory_usage":%d}}'
+_ERR_NO_PROCESS_TMPL = b'{"status":"error","command_uid":%b,"message":"No OBS Studio process found with the given \'app_pid\'."}'
+
+async def _writer(websocket: ServerConnection, out_q: asyncio.Queue):
+    """Drain the outbound queue and push responses onto the socket.
+
+    Runs as a dedicated task per connection so response production is
+    decoupled from the socket drain. When several responses are already
+    queued they are drained in one wakeup and sent back-to-back, amortizing
+    the queue round trip during bursts. Each response stays its own message:
+    passing the whole batch to send() would emit one fragmented message whose
+    payload is the concatenation of every response, which no JSON client can
+    parse.
+    """
+    try:
+        while True:
+            msg = await out_q.get()
+            if out_q.empty():
+                await websocket.send(msg)
+                continue
+            batch = [msg]
+            while not out_q.empty() and len(batch) < OUTBOUND_BATCH_SIZE:
+                batch.append(out_q.get_nowait())
+            for msg in batch:
+                await websocket.send(msg)
+    except ConnectionClosed:
+        # Peer dropped mid-send; handle_connection observes the closure and
+        # runs cleanup, so just exit instead of leaving an unretrieved
+        # exception on the task.
+        pass
+
+# Connection ids only need to be unique within this process; a monotonic
+# counter is far cheaper than uuid4() and yields shorter keys to hash and log.
+_pid_seq = itertools.count(1)
+
+async def handle_connection(websocket: ServerConnection):
+    pid = f"c{next(_pid_seq):x}"
+    out_q: asyncio.Queue = asyncio.Queue(maxsize=OUTBOUND_QUEUE_MAXSIZE)
+    writer_task = asyncio.create_task(_writer(websocket, out_q))
+    connections[pid] = ConnectionState(
+        websocket=websocket,
+        out_q=out_q,
+        writer_task=writer_task,
+    )
+    logger.info("New connection established with pid: %s", pid)
 
     try:
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         async for message in websocket:
-            log_debug(f"Received message from pid {pid}: {message}")
+            if debug_enabled:
+                logger.debug("Received message from pid %s: %s", pid, message)
             response = await process_message(pid, message)
-            await websocket.send(response)
-            log_debug(f"Sent response to pid {pid}: {response}")
+            if writer_task.done():
+                # The writer exited (peer gone); a blocking put could wedge
+                # this coroutine forever on a full queue, so stop here and
+                # let cleanup run.
+                break
+            try:
+                out_q.put_nowait(response)
+            except asyncio.QueueFull:
+                logger.warning("Outbound queue full for pid %s; dropping response.", pid)
+                continue
+            if debug_enabled:
+                logger.debug("Queued response to pid %s: %s", pid, response)
     except ConnectionClosedOK:
-        log_info(f"Connection closed normally for pid: {pid}")
+        logger.info("Connection closed normally for pid: %s", pid)
     except ConnectionClosedError as e:
-        log_warning(f"Connection closed with error for pid: {pid}: {e}")
+        logger.warning("Connection closed with error for pid: %s: %s", pid, e)
     except Exception as e:
-        log_error(f"Unexpected error with pid {pid}: {e}")
+        logger.error("Unexpected error with pid %s: %s", pid, e)
     finally:
         await cleanup_connection(pid)
 
-async def process_message(pid: str, message: str) -> str:
+async def process_message(pid: str, message: Union[bytes, str]) -> bytes:
     try:
-        command_data = json.loads(message)
+        # Clients send binary frames of UTF-8 JSON (no text-frame UTF-8
+        # validation in the library); json_loads accepts bytes or str, so
+        # legacy text frames still work.
+        command_data = json_loads(message)
         command = command_data.get("command")
         command_uid = command_data.get("command_uid")
         parameters = command_data.get("parameter", {})
 
         if not command_uid or not command:
-            return create_json_response(command_uid or "unknown", "error", "Both 'command' and 'command_uid' are required.")
-
-        command_handlers = {
-            "CONNECT_SERVER": connect_server,
-            "DISCONNECT_SERVER": disconnect_server,
-            "OPEN_OBS_STUDIO": open_obs_studio,
-            "GET_OBS_STUDIO_STATUS": get_obs_studio_status,
-        }
+            return _ERR_MISSING_FIELDS_TMPL % json_dumps(command_uid or "unknown")
 
-        handler = command_handlers.get(command)
+        handler = COMMAND_HANDLERS.get(command)
         if handler:
             return await handler(command_uid, pid, parameters)
         else:
-            return create_json_response(command_uid, "error", f"Unknown command: {command}")
-    except json.JSONDecodeError:
-        log_warning(f"Invalid JSON received from pid {pid}")
-        return create_json_response("unknown", "error", "Invalid JSON format.")
+            return _ERR_UNKNOWN_COMMAND_TMPL % (json_dumps(command_uid), json_dumps(f"Unknown command: {command}"))
+    except JSONDecodeError:
+        logger.warning("Invalid JSON received from pid %s", pid)
+        return _ERR_INVALID_JSON
     except Exception as e:
-        log_error(f"Error processing message from pid {pid}: {e}")
+        logger.error("Error processing message from pid %s: %s", pid, e)
         return create_json_response("unknown", "error", f"An unexpected error occurred: {str(e)}")
 
-async def connect_server(command_uid: str, pid: str, parameters: Dict[str, Any]) -> str:
+async def connect_server(command_uid: str, pid: str, parameters: Dict[str, Any]) -> bytes:
     ip_address = parameters.get("ip_address", DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS)
     port = parameters.get("port", DEFAULT_WEBSOCKET_SERVER_PORT)
-    log_info(f"WebSocket connected for pid: {pid} at {ip_address}:{port}")
-    return create_json_response(command_uid, "success", "WebSocket connected successfully.", {"ip_address": ip_address, "port": port, "pid": pid})
+    logger.info("WebSocket connected for pid: %s at %s:%s", pid, ip_address, port)
+    return _OK_CONNECTED_TMPL % (json_dumps(command_uid), json_dumps(ip_address), int(port), json_dumps(pid))
 
-async def disconnect_server(command_uid: str, pid: str, parameters: Dict[str, Any]) -> str:
-    websocket = connections.get(pid, {}).get("websocket")
+async def disconnect_server(command_uid: str, pid: str, parameters: Dict[str, Any]) -> bytes:
+    state = connections.get(pid)
+    websocket = state.websocket if state else None
     if websocket:
         await websocket.close()
-        log_info(f"WebSocket disconnected for pid: {pid}")
-        return create_json_response(command_uid, "success", "WebSocket disconnected successfully.")
+        logger.info("WebSocket disconnected for pid: %s", pid)
+        return _OK_DISCONNECTED_TMPL % json_dumps(command_uid)
     else:
-        log_warning(f"Attempted to disconnect nonexistent WebSocket for pid: {pid}")
-        return create_json_response(command_uid, "error", "WebSocket connection not found.")
-
-async def open_obs_studio(command_uid: str, pid: str, parameters: Dict[str, Any]) -> str:
+        logger.warning("Attempted to disconnect nonexistent WebSocket for pid: %s", pid)
+        return _ERR_NO_CONNECTION_TMPL % json_dumps(command_uid)
+
+# Shared devnull fd for discarding subprocess output; opened once instead of
+# twice per launch (stdout + stderr) and closed at interpreter exit.
+_DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
+atexit.register(os.close, _DEVNULL_FD)
+
+# Launching the same executable repeatedly is the common case; cache the
+# existence check for a few seconds so each launch does not re-stat the path.
+_IS_FILE_TTL_SECONDS = 5.0
+
+@functools.lru_cache(maxsize=32)
+def _is_file_in_bucket(path: str, ttl_bucket: int) -> bool:
+    return os.path.isfile(path)
+
+def _is_file_cached(path: str) -> bool:
+    return _is_file_in_bucket(path, int(time.monotonic() / _IS_FILE_TTL_SECONDS))
+
+async def _watch_exit(pid: str, process: Any):
+    """Clear the connection's obs_process reference once the subprocess exits,
+    so liveness checks are a pure attribute test and exited processes are
+    reaped promptly."""
+    await process.wait()
+    state = connections.get(pid)
+    if state and state.obs_process is process:
+        state.obs_process = None
+        logger.info("OBS Studio process %s exited for pid: %s", process.pid, pid)
+
+async def open_obs_studio(command_uid: str, pid: str, parameters: Dict[str, Any]) -> bytes:
     """Open OBS Studio."""
     if pid not in connections:
-        log_warning(f"Invalid pid {pid} for OPEN_OBS_STUDIO command.")
-        return create_json_response(command_uid, "error", "Invalid connection PID.")
-
-    obs_process = connections[pid].get("obs_process")
-    if obs_process and obs_process.poll() is None:
-        log_info(f"OBS Studio is already running for pid: {pid}")
-        return create_json_response(command_uid, "error", "OBS Studio is already running.")
-
-    # Get the executable path and additional parameters
-    executable_path = parameters.get("path", DEFAULT_OBS_STUDIO_EXECUTABLE_PATH)
+        logger.warning("Invalid pid %s for OPEN_OBS_STUDIO command.", pid)
+        return _ERR_INVALID_PID_TMPL % json_dumps(command_uid)
+
+    # obs_process is cleared by _watch_exit when the subprocess exits, so a
+    # plain attribute test is enough here -- no per-request liveness syscall.
+    if connections[pid].obs_process is not None:
+        logger.info("OBS Studio is already running for pid: %s", pid)
+        return _ERR_ALREADY_RUNNING_TMPL % json_dumps(command_uid)
+
+    # Get the executable path and additional parameters; the default path and
+    # its parent are precomputed, so only client-supplied paths are parsed here
+    custom_path = parameters.get("path")
+    if custom_path:
+        executable_path = Path(custom_path)
+        working_directory = executable_path.parent
+    else:
+        executable_path = DEFAULT_OBS_STUDIO_EXECUTABLE_PATH
+        working_directory = DEFAULT_OBS_STUDIO_WORKING_DIRECTORY_PATH
     param_path = parameters.get("param_path", "")
 
-    # Determine the working directory based on the executable path
-    working_directory = os.path.dirname(executable_path)
-
-    if not os.path.isfile(executable_path):
-        log_error(f"Executable not found at path: {executable_path}")
-        return create_json_response(command_uid, "error", "OBS Studio executable not found.", {"path": executable_path})
+    if not _is_file_cached(str(executable_path)):
+        logger.error("Executable not found at path: %s", executable_path)
+        return create_json_response(command_uid, "error", "OBS Studio executable not found.", {"path": str(executable_path)})
 
     try:
-        # Prepare the command with additional parameters if provided
+        # Prepare the command with additional parameters if provided.
+        # Clients may pass param_path as a pre-split argument list (used
+        # as-is) or as a single string, which is tokenized with shlex so
+        # quoted arguments survive intact.
         command = [executable_path]
-        if param_path:
-            command.extend(param_path.split())
+        if isinstance(param_path, list):
+            command.extend(param_path)
+        elif param_path:
+            command.extend(shlex.split(param_path, posix=False))
 
         process = await asyncio.create_subprocess_exec(
             *command,
             cwd=working_directory,
-            stdout=asyncio.subprocess.DEVNULL,
-            stderr=asyncio.subprocess.DEVNULL
+            stdout=_DEVNULL_FD,
+            stderr=_DEVNULL_FD
         )
-        connections[pid]["obs_process"] = process
-        log_info(f"OBS Studio launched for pid: {pid} with process id: {process.pid}")
-        return create_json_response(command_uid, "success", "OBS Studio launched successfully.", {"app_pid": process.pid})
+        connections[pid].obs_process = process
+        asyncio.create_task(_watch_exit(pid, process))
+        logger.info("OBS Studio launched for pid: %s with process id: %s", pid, process.pid)
+        return _OK_LAUNCHED_TMPL % (json_dumps(command_uid), process.pid)
     except Exception as e:
-        log_error(f"Failed to launch OBS Studio for pid: {pid}: {e}")
+        logger.error("Failed to launch OBS Studio for pid: %s: %s", pid, e)
         return create_json_response(command_uid, "error", "Failed to launch OBS Studio.", {"error": str(e)})
 
-async def get_obs_studio_status(command_uid: str, pid: str, parameters: Dict[str, Any]) -> str:
+# Cached psutil.Process handles keyed by app_pid. Reusing the handle lets the
+# non-blocking cpu_percent(interval=0.0) return a real delta since the previous
+# sample instead of priming from scratch on every query.
+_process_cache: Dict[int, psutil.Process] = {}
+
+# Status queries are the archetypal poll: several clients can ask about the
+# same app_pid in quick succession. Samples are cached for a short TTL so one
+# psutil read per pid per tick serves all concurrent pollers, instead of
+# hammering /proc once per request.
+STATUS_CACHE_TTL_SECONDS = 0.1
+_status_cache: Dict[int, tuple] = {}
+
+def _sample_process_status(app_pid: int):
+    """Read status, memory and CPU usage for a process in a single pass.
+
+    Blocking; intended to be run via asyncio.to_thread. oneshot() caches the
+    underlying process reads so the three queries share one syscall batch.
+    """
+    process = _process_cache.get(app_pid)
+    if process is None:
+        process = psutil.Process(app_pid)
+        _process_cache[app_pid] = process
+    try:
+        with process.oneshot():
+            return process.status(), process.memory_info(), process.cpu_percent(interval=0.0)
+    except psutil.NoSuchProcess:
+        _process_cache.pop(app_pid, None)
+        _status_cache.pop(app_pid, None)
+        raise
+
+async def _get_process_status(app_pid: int):
+    """Return a (status, memory_info, cpu_usage) sample, reusing a recent one
+    when available."""
+    cached = _status_cache.get(app_pid)
+    if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL_SECONDS:
+        return cached[1]
+    sample = await asyncio.to_thread(_sample_process_status, app_pid)
+    _status_cache[app_pid] = (time.monotonic(), sample)
+    return sample
+
+async def get_obs_studio_status(command_uid: str, pid: str, parameters: Dict[str, Any]) -> bytes:
     app_pid = parameters.get("app_pid")
 
     if not isinstance(app_pid, int):
-        log_warning(f"Invalid app_pid provided by pid {pid}: {app_pid}")
+        logger.warning("Invalid app_pid provided by pid %s: %s", pid, app_pid)
         return create_json_response(command_uid, "error", "Invalid 'app_pid'; must be an integer.")
 
     try:
-        process = psutil.Process(app_pid)
-        if process.is_running():
-            cpu_usage = process.cpu_percent(interval=0.1)
-            memory_info = process.memory_info()
-            status = process.status()
-            log_info(f"Retrieved OBS Studio status for app_pid: {app_pid}")
-            return create_json_response(command_uid, "success", "OBS Studio is running.", {"app_pid": app_pid, "status": status, "cpu_usage": cpu_usage, "memory_usage": memory_info.rss})
-        else:
-            log_warning(f"OBS Studio process with app_pid {app_pid} is not running.")
-            return create_json_response(command_uid, "error", "OBS Studio is not running.")
+        # psutil reads /proc (or queries NT) synchronously, so the sampling
+        # runs in a worker thread to keep the event loop servicing frames;
+        # recent samples are served from the TTL cache without any syscall.
+        status, memory_info, cpu_usage = await _get_process_status(app_pid)
+        logger.info("Retrieved OBS Studio status for app_pid: %s", app_pid)
+        return _OK_STATUS_TMPL % (json_dumps(command_uid), app_pid, json_dumps(status), cpu_usage, memory_info.rss)
     except psutil.NoSuchProcess:
-        log_error(f"No process found with app_pid: {app_pid}")
-        return create_json_response(command_uid, "error", "No OBS Studio process found with the given 'app_pid'.")
+        logger.error("No process found with app_pid: %s", app_pid)
+        return _ERR_NO_PROCESS_TMPL % json_dumps(command_uid)
     except Exception as e:
-        log_error(f"Error retrieving OBS Studio status for app_pid {app_pid}: {e}")
+        logger.error("Error retrieving OBS Studio status for app_pid %s: %s", app_pid, e)
         return create_json_response(command_uid, "error", "Failed to retrieve OBS Studio status.", {"error": str(e)})
 
+# Command dispatch table, built once at import time instead of per message
+COMMAND_HANDLERS = {
+    "CONNECT_SERVER": connect_server,
+    "DISCONNECT_SERVER": disconnect_server,
+    "OPEN_OBS_STUDIO": open_obs_studio,
+    "GET_OBS_STUDIO_STATUS": get_obs_studio_status,
+}
+
+# How long to wait after terminate() before escalating to kill()
+OBS_TERMINATE_TIMEOUT_SECONDS = 5.0
+
 async def cleanup_connection(pid: str):
     connection = connections.pop(pid, None)
     if connection:
-        obs_process = connection.get("obs_process")
+        if connection.writer_task:
+            connection.writer_task.cancel()
+            try:
+                await connection.writer_task
+            except asyncio.CancelledError:
+                pass
+            except Exception as e:
+                logger.error("Writer task failed for pid %s: %s", pid, e)
+        obs_process = connection.obs_process
         if obs_process and obs_process.returncode is None:
             obs_process.terminate()
             try:
-                await obs_process.wait()
-                log_info(f"OBS Studio process terminated for pid: {pid}")
+                # Bound the wait so a hung OBS cannot pin this coroutine (and
+                # the connection state) forever; escalate to kill() if needed.
+                try:
+                    await asyncio.wait_for(obs_process.wait(), OBS_TERMINATE_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    logger.warning("OBS Studio process did not terminate in time for pid %s; killing it.", pid)
+                    obs_process.kill()
+                    await obs_process.wait()
+                logger.info("OBS Studio process terminated for pid: %s", pid)
             except Exception as e:
-                log_error(f"Error terminating OBS Studio process for pid {pid}: {e}")
-        log_info(f"Cleaned up connection for pid: {pid}")
+                logger.error("Error terminating OBS Studio process for pid %s: %s", pid, e)
+        connection.obs_process = None
+        logger.info("Cleaned up connection for pid: %s", pid)
     else:
-        log_warning(f"No connection found to clean up for pid: {pid}")
+        logger.warning("No connection found to clean up for pid: %s", pid)
 
 async def start_server():
-    server = await websockets.serve(handle_connection, DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS, DEFAULT_WEBSOCKET_SERVER_PORT)
-    log_info(f"WebSocket server started on ws://{DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS}:{DEFAULT_WEBSOCKET_SERVER_PORT}")
+    # max_queue=None removes the library's early backpressure on inbound
+    # frames, which raises throughput on sustained bursts; max_size stays
+    # bounded (1 MiB) so oversized frames cannot exhaust memory.
+    # compression=None turns off permessage-deflate: the command frames are
+    # small JSON objects where the zlib round trip costs more CPU than the
+    # bytes it saves.
+    server = await serve(
+        handle_connection,
+        DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS,
+        DEFAULT_WEBSOCKET_SERVER_PORT,
+        max_queue=None,
+        max_size=2 ** 20,
+        ping_interval=20,
+        ping_timeout=20,
+        compression=None,
+    )
+    logger.info("WebSocket server started on ws://%s:%s", DEFAULT_WEBSOCKET_SERVER_IP_ADDRESS, DEFAULT_WEBSOCKET_SERVER_PORT)
     await server.wait_closed()
 
 def main():
-    log_info("===== OBS STUDIO WEBSOCKET LAUNCHER STARTING =====")
+    logger.info("===== OBS STUDIO WEBSOCKET LAUNCHER STARTING =====")
+    # Use uvloop (libuv-backed event loop) when available for faster socket
+    # handling; fall back to the default loop on platforms without it (e.g. Windows).
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop policy.")
+    except ImportError:
+        logger.info("uvloop not available; using default asyncio event loop.")
     try:
         asyncio.run(start_server())
     except Exception as e:
-        log_error(f"Server encountered an error: {e}")
+        logger.error("Server encountered an error: %s", e)
     finally:
-        log_info("WebSocket server stopped.")
+        logger.info("WebSocket server stopped.")
+        log_listener.stop()
 
 if __name__ == "__main__":
     main()